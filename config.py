@@ -10,6 +10,8 @@ load_dotenv()
 # LLM Configuration - Can be overridden with environment variables
 LLM_MODEL = os.getenv('LLM_MODEL', 'gemini-2.5-pro-preview-05-06')
 LLM_TEMPERATURE = float(os.getenv('LLM_TEMPERATURE', '1'))
+# Maximum number of prompts sent to the LLM concurrently per language
+MAX_CONCURRENT_PROMPTS = int(os.getenv('MAX_CONCURRENT_PROMPTS', '8'))
 
 # PDF Generation Configuration
 PDF_CONFIG = {
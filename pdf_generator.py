@@ -7,6 +7,7 @@ from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from datetime import datetime
+from functools import lru_cache
 import yaml
 from bs4 import BeautifulSoup, Comment
 import re
@@ -14,6 +15,422 @@ from typing import Optional, Dict, List, Tuple, Any
 from config import SECTION_ORDER, PDF_CONFIG
 from pydantic import BaseModel
 
+# Stylesheet applied to every generated report
+REPORT_CSS = '''
+@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+JP:wght@400;700&family=Noto+Sans:wght@400;700&display=swap');
+
+/* Base styles */
+body { 
+    font-family: 'Noto Sans', 'Noto Sans JP', sans-serif;
+    line-height: 1.6;
+}
+
+/* Table of contents styles */
+.toc-container {
+    margin: 1em 0 2em 0;
+}
+
+.toc-title {
+    font-size: 18pt;
+    color: #000b37;
+    margin-bottom: 1.5em;
+    text-align: center;
+    font-weight: bold;
+    letter-spacing: 0.05em;
+    border-bottom: none;
+}
+
+.toc-entries {
+    padding: 0 1em;
+}
+
+.toc-entry {
+    margin: 0.8em 0;
+    position: relative;
+    display: flex;
+    align-items: baseline;
+    justify-content: space-between;
+}
+
+.toc-entry::after {
+    content: "";
+    position: absolute;
+    bottom: 0.5em;
+    left: 0;
+    right: 0;
+    border-bottom: 1px dotted #c7c7c7;
+    z-index: 1;
+}
+
+.toc-link {
+    font-weight: bold;
+    font-size: 12pt;
+    color: #000b37;
+    text-decoration: none;
+    background: white;
+    padding-right: 0.5em;
+    position: relative;
+    z-index: 2;
+    display: inline-block;
+    width: auto;
+    max-width: 80%;
+}
+
+.toc-link::after {
+    content: target-counter(attr(href), page);
+    position: absolute;
+    right: -4em;
+    background: white;
+    padding: 0 0.5em;
+    color: #474747;
+    z-index: 2;
+    font-weight: normal;
+}
+
+/* Enhanced table styles */
+.table-responsive {
+    margin: 1.5em 0;
+    width: 100%;
+    overflow-x: auto;
+    border: 1px solid #dee2e6;
+    border-radius: 4px;
+    padding: 0.5em;
+}
+
+.enhanced-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-bottom: 1em;
+    font-size: 0.95em;
+}
+
+.enhanced-table, .enhanced-table * {
+    box-sizing: border-box;
+}
+
+.enhanced-table thead {
+    display: table-header-group;
+}
+
+.enhanced-table tbody {
+    display: table-row-group;
+}
+
+.enhanced-table tr {
+    display: table-row;
+}
+
+.enhanced-table th, .enhanced-table td {
+    display: table-cell;
+    border: 1px solid #dee2e6;
+    word-break: normal;
+    word-wrap: break-word;
+    vertical-align: middle;
+    max-width: 300px;
+    padding: 8px 12px;
+}
+
+.enhanced-table th {
+    background-color: #f0f2f5;
+    border-bottom: 2px solid #000b37;
+    text-align: left;
+    font-weight: 600;
+    color: #000b37;
+}
+
+.enhanced-table td {
+    background-color: #ffffff;
+}
+
+.enhanced-table tr:nth-child(even) td { 
+    background-color: #f9f9f9;
+}
+
+.enhanced-table tr:hover td { 
+    background-color: rgba(130, 137, 236, 0.1);
+}
+
+.enhanced-table .text-right {
+    text-align: right;
+}
+
+.enhanced-table .text-center {
+    text-align: center;
+}
+
+/* Manual tables (converted from markdown text) */
+.manual-table {
+    border: 2px solid #dee2e6;
+}
+
+.manual-table th,
+.manual-table td {
+    padding: 10px 12px;
+}
+
+/* Ensure tables break correctly between pages */
+table, tr, td, th, tbody, thead, tfoot {
+    page-break-inside: auto !important;
+}
+
+/* Force table to a new page if it would break */
+table { 
+}
+
+/* Enhanced list styles */
+.enhanced-list {
+    padding-left: 1.5em;
+    margin: 0.8em 0;
+    list-style-type: disc;
+}
+
+.enhanced-list-item {
+    margin-bottom: 0.3em;
+    text-align: left;
+}
+
+.nested-list {
+    padding-left: 1.5em;
+    margin: 0.5em 0;
+    list-style-type: circle;
+}
+
+.nested-list-item {
+    margin-bottom: 0.2em;
+}
+
+/* Section cover styling */
+.section-cover {
+    page-break-before: always;
+    page-break-after: always;
+    height: 29.7cm;
+    padding: 4cm 3cm;
+    position: relative;
+    background: linear-gradient(145deg, #f8f9fa 0%, #f1f1f1 100%);
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    text-align: center;
+}
+
+.section-cover::before {
+    content: "";
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 15px;
+    height: 100%;
+    background: linear-gradient(to bottom, #85c20b, #0056b3);
+    border-right: 1px solid rgba(0, 0, 0, 0.05);
+}
+
+.section-cover h2 {
+    font-size: 36pt;
+    margin-bottom: 2.5cm;
+    color: #000b37;
+    border: none;
+    font-weight: bold;
+    line-height: 1.2;
+    position: relative;
+    padding-bottom: 0.5cm;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+}
+
+.section-cover h2::after {
+    content: "";
+    position: absolute;
+    bottom: 0;
+    left: 50%;
+    transform: translateX(-50%);
+    width: 8cm;
+    height: 3px;
+    background: linear-gradient(90deg, #0056b3, #85c20b);
+}
+
+.section-cover .subsections {
+    margin: 0 auto;
+    text-align: left;
+    width: 80%;
+    max-width: 600px;
+    background: #ffffff;
+    padding: 1.5cm;
+    border-radius: 8px;
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
+}
+
+.section-cover .subsections h3 {
+    font-size: 18pt;
+    color: #0056b3;
+    margin-bottom: 1cm;
+    text-align: center;
+    border: none;
+    font-weight: normal;
+}
+
+.section-cover .subsections p {
+    text-align: center;
+    margin-bottom: 1.5cm;
+    font-size: 12pt;
+    color: #34495e;
+    line-height: 1.6;
+    font-style: italic;
+}
+
+.section-cover .key-topics {
+    margin-top: 1cm;
+    list-style-type: none;
+    padding: 0;
+}
+
+.section-cover .key-topics li {
+    margin: 0.5cm 0;
+    padding: 0.25cm 0.5cm;
+    background-color: #f8f9fa;
+    border-left: 3px solid #85c20b;
+    text-align: left;
+    color: #000b37;
+    font-size: 12pt;
+    border-radius: 3px;
+}
+
+.section-cover .reading-time {
+    margin-top: 3cm;
+    font-size: 12pt;
+    color: #7f8c8d;
+    font-style: italic;
+    background: #ffffff;
+    padding: 0.4cm 1cm;
+    border-radius: 50px;
+    box-shadow: 0 2px 6px rgba(0, 0, 0, 0.05);
+}
+
+.section-cover .reading-time-value {
+    font-weight: bold;
+    color: #0056b3;
+}
+
+/* Executive summary styling */
+.executive-summary {
+    margin: 2em 0;
+    padding: 2em;
+    background-color: #f8f9fa;
+    border-left: 6px solid #0056b3;
+    border-radius: 6px;
+    page-break-before: always;
+    page-break-after: always;
+    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
+}
+
+.executive-summary-header {
+    margin-bottom: 1.5em;
+    border-bottom: 2px solid #dee2e6;
+    padding-bottom: 1em;
+}
+
+.executive-summary-label {
+    font-size: 2em;
+    font-weight: 700;
+    color: #0056b3;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+}
+
+.executive-summary h3 {
+    color: #0056b3;
+    font-size: 1.4em;
+    margin-top: 1.8em;
+    margin-bottom: 1em;
+    font-weight: 600;
+    border-bottom: 1px solid #e9ecef;
+    padding-bottom: 0.5em;
+}
+
+.executive-summary p {
+    text-align: justify;
+    line-height: 1.6;
+    margin-bottom: 1em;
+}
+
+.executive-summary ul, .executive-summary ol {
+    margin-left: 1.5em;
+    margin-bottom: 1.5em;
+}
+
+.executive-summary li {
+    margin-bottom: 0.8em;
+}
+
+.executive-summary table {
+    width: 100%;
+    margin: 1.5em 0;
+    border-collapse: collapse;
+    box-shadow: 0 2px 6px rgba(0, 0, 0, 0.05);
+}
+
+.executive-summary table th {
+    background-color: #e9ecef;
+    font-weight: 600;
+    text-align: left;
+    padding: 0.8em;
+    border: 1px solid #dee2e6;
+    color: #0056b3;
+}
+
+.executive-summary table td {
+    padding: 0.8em;
+    border: 1px solid #dee2e6;
+    vertical-align: top;
+}
+
+.executive-summary strong {
+    color: #0056b3;
+    font-weight: 600;
+}
+
+.executive-summary-content {
+    margin-top: 1.5em;
+    line-height: 1.6;
+}
+
+.executive-summary-content h2, 
+.executive-summary-content h3, 
+.executive-summary-content h4 {
+    color: #0056b3;
+    margin-top: 1.5em;
+    margin-bottom: 0.8em;
+}
+
+.executive-summary-content ol {
+    counter-reset: item;
+    list-style-type: none;
+    margin-left: 0;
+    padding-left: 0;
+}
+
+.executive-summary-content ol li {
+    counter-increment: item;
+    margin-bottom: 1.2em;
+    padding-left: 2em;
+    position: relative;
+}
+
+.executive-summary-content ol li:before {
+    content: counter(item) ".";
+    position: absolute;
+    left: 0;
+    font-weight: bold;
+    color: #0056b3;
+}
+'''
+
+@lru_cache(maxsize=1)
+def _get_report_stylesheet() -> Tuple[FontConfiguration, CSS]:
+    """Parse REPORT_CSS once per process and return it with its font configuration."""
+    font_config = FontConfiguration()
+    return font_config, CSS(string=REPORT_CSS, font_config=font_config)
+
 class PDFSection(BaseModel):
     """Model for a section in the PDF."""
     id: str
@@ -44,6 +461,9 @@ class EnhancedPDFGenerator:
         )
         self.template = self.env.get_template(self.template_name)
         
+        # Font configuration and report stylesheet shared by all generators
+        self.font_config, self.css = _get_report_stylesheet()
+        
         # Initialize markdown with an expanded set of extensions
         self.md = markdown.Markdown(extensions=[
             'extra',  # Includes tables, fenced_code, footnotes, etc.
@@ -916,424 +1336,12 @@ class EnhancedPDFGenerator:
                 f.write(html_content)
                 print(f"Saved debug HTML to: {debug_html_path}")
             
-            # Configure font and CSS
-            font_config = FontConfiguration()
-            css = CSS(string='''
-                @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+JP:wght@400;700&family=Noto+Sans:wght@400;700&display=swap');
-                
-                /* Base styles */
-                body { 
-                    font-family: 'Noto Sans', 'Noto Sans JP', sans-serif;
-                    line-height: 1.6;
-                }
-                
-                /* Table of contents styles */
-                .toc-container {
-                    margin: 1em 0 2em 0;
-                }
-                
-                .toc-title {
-                    font-size: 18pt;
-                    color: #000b37;
-                    margin-bottom: 1.5em;
-                    text-align: center;
-                    font-weight: bold;
-                    letter-spacing: 0.05em;
-                    border-bottom: none;
-                }
-                
-                .toc-entries {
-                    padding: 0 1em;
-                }
-                
-                .toc-entry {
-                    margin: 0.8em 0;
-                    position: relative;
-                    display: flex;
-                    align-items: baseline;
-                    justify-content: space-between;
-                }
-                
-                .toc-entry::after {
-                    content: "";
-                    position: absolute;
-                    bottom: 0.5em;
-                    left: 0;
-                    right: 0;
-                    border-bottom: 1px dotted #c7c7c7;
-                    z-index: 1;
-                }
-                
-                .toc-link {
-                    font-weight: bold;
-                    font-size: 12pt;
-                    color: #000b37;
-                    text-decoration: none;
-                    background: white;
-                    padding-right: 0.5em;
-                    position: relative;
-                    z-index: 2;
-                    display: inline-block;
-                    width: auto;
-                    max-width: 80%;
-                }
-                
-                .toc-link::after {
-                    content: target-counter(attr(href), page);
-                    position: absolute;
-                    right: -4em;
-                    background: white;
-                    padding: 0 0.5em;
-                    color: #474747;
-                    z-index: 2;
-                    font-weight: normal;
-                }
-                
-                /* Enhanced table styles */
-                .table-responsive {
-                    margin: 1.5em 0;
-                    width: 100%;
-                    overflow-x: auto;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 0.5em;
-                }
-                
-                .enhanced-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-bottom: 1em;
-                    font-size: 0.95em;
-                }
-                
-                .enhanced-table, .enhanced-table * {
-                    box-sizing: border-box;
-                }
-                
-                .enhanced-table thead {
-                    display: table-header-group;
-                }
-                
-                .enhanced-table tbody {
-                    display: table-row-group;
-                }
-                
-                .enhanced-table tr {
-                    display: table-row;
-                }
-                
-                .enhanced-table th, .enhanced-table td {
-                    display: table-cell;
-                    border: 1px solid #dee2e6;
-                    word-break: normal;
-                    word-wrap: break-word;
-                    vertical-align: middle;
-                    max-width: 300px;
-                    padding: 8px 12px;
-                }
-                
-                .enhanced-table th {
-                    background-color: #f0f2f5;
-                    border-bottom: 2px solid #000b37;
-                    text-align: left;
-                    font-weight: 600;
-                    color: #000b37;
-                }
-                
-                .enhanced-table td {
-                    background-color: #ffffff;
-                }
-                
-                .enhanced-table tr:nth-child(even) td { 
-                    background-color: #f9f9f9;
-                }
-                
-                .enhanced-table tr:hover td { 
-                    background-color: rgba(130, 137, 236, 0.1);
-                }
-                
-                .enhanced-table .text-right {
-                    text-align: right;
-                }
-                
-                .enhanced-table .text-center {
-                    text-align: center;
-                }
-                
-                /* Manual tables (converted from markdown text) */
-                .manual-table {
-                    border: 2px solid #dee2e6;
-                }
-                
-                .manual-table th,
-                .manual-table td {
-                    padding: 10px 12px;
-                }
-                
-                /* Ensure tables break correctly between pages */
-                table, tr, td, th, tbody, thead, tfoot {
-                    page-break-inside: auto !important;
-                }
-                
-                /* Force table to a new page if it would break */
-                table { 
-                }
-                
-                /* Enhanced list styles */
-                .enhanced-list {
-                    padding-left: 1.5em;
-                    margin: 0.8em 0;
-                    list-style-type: disc;
-                }
-                
-                .enhanced-list-item {
-                    margin-bottom: 0.3em;
-                    text-align: left;
-                }
-                
-                .nested-list {
-                    padding-left: 1.5em;
-                    margin: 0.5em 0;
-                    list-style-type: circle;
-                }
-                
-                .nested-list-item {
-                    margin-bottom: 0.2em;
-                }
-                
-                /* Section cover styling */
-                .section-cover {
-                    page-break-before: always;
-                    page-break-after: always;
-                    height: 29.7cm;
-                    padding: 4cm 3cm;
-                    position: relative;
-                    background: linear-gradient(145deg, #f8f9fa 0%, #f1f1f1 100%);
-                    display: flex;
-                    flex-direction: column;
-                    align-items: center;
-                    justify-content: center;
-                    text-align: center;
-                }
-                
-                .section-cover::before {
-                    content: "";
-                    position: absolute;
-                    top: 0;
-                    left: 0;
-                    width: 15px;
-                    height: 100%;
-                    background: linear-gradient(to bottom, #85c20b, #0056b3);
-                    border-right: 1px solid rgba(0, 0, 0, 0.05);
-                }
-                
-                .section-cover h2 {
-                    font-size: 36pt;
-                    margin-bottom: 2.5cm;
-                    color: #000b37;
-                    border: none;
-                    font-weight: bold;
-                    line-height: 1.2;
-                    position: relative;
-                    padding-bottom: 0.5cm;
-                    text-transform: uppercase;
-                    letter-spacing: 0.05em;
-                }
-                
-                .section-cover h2::after {
-                    content: "";
-                    position: absolute;
-                    bottom: 0;
-                    left: 50%;
-                    transform: translateX(-50%);
-                    width: 8cm;
-                    height: 3px;
-                    background: linear-gradient(90deg, #0056b3, #85c20b);
-                }
-                
-                .section-cover .subsections {
-                    margin: 0 auto;
-                    text-align: left;
-                    width: 80%;
-                    max-width: 600px;
-                    background: #ffffff;
-                    padding: 1.5cm;
-                    border-radius: 8px;
-                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-                }
-                
-                .section-cover .subsections h3 {
-                    font-size: 18pt;
-                    color: #0056b3;
-                    margin-bottom: 1cm;
-                    text-align: center;
-                    border: none;
-                    font-weight: normal;
-                }
-                
-                .section-cover .subsections p {
-                    text-align: center;
-                    margin-bottom: 1.5cm;
-                    font-size: 12pt;
-                    color: #34495e;
-                    line-height: 1.6;
-                    font-style: italic;
-                }
-                
-                .section-cover .key-topics {
-                    margin-top: 1cm;
-                    list-style-type: none;
-                    padding: 0;
-                }
-                
-                .section-cover .key-topics li {
-                    margin: 0.5cm 0;
-                    padding: 0.25cm 0.5cm;
-                    background-color: #f8f9fa;
-                    border-left: 3px solid #85c20b;
-                    text-align: left;
-                    color: #000b37;
-                    font-size: 12pt;
-                    border-radius: 3px;
-                }
-                
-                .section-cover .reading-time {
-                    margin-top: 3cm;
-                    font-size: 12pt;
-                    color: #7f8c8d;
-                    font-style: italic;
-                    background: #ffffff;
-                    padding: 0.4cm 1cm;
-                    border-radius: 50px;
-                    box-shadow: 0 2px 6px rgba(0, 0, 0, 0.05);
-                }
-                
-                .section-cover .reading-time-value {
-                    font-weight: bold;
-                    color: #0056b3;
-                }
-                
-                /* Executive summary styling */
-                .executive-summary {
-                    margin: 2em 0;
-                    padding: 2em;
-                    background-color: #f8f9fa;
-                    border-left: 6px solid #0056b3;
-                    border-radius: 6px;
-                    page-break-before: always;
-                    page-break-after: always;
-                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
-                }
-                
-                .executive-summary-header {
-                    margin-bottom: 1.5em;
-                    border-bottom: 2px solid #dee2e6;
-                    padding-bottom: 1em;
-                }
-                
-                .executive-summary-label {
-                    font-size: 2em;
-                    font-weight: 700;
-                    color: #0056b3;
-                    text-transform: uppercase;
-                    letter-spacing: 0.05em;
-                }
-                
-                .executive-summary h3 {
-                    color: #0056b3;
-                    font-size: 1.4em;
-                    margin-top: 1.8em;
-                    margin-bottom: 1em;
-                    font-weight: 600;
-                    border-bottom: 1px solid #e9ecef;
-                    padding-bottom: 0.5em;
-                }
-                
-                .executive-summary p {
-                    text-align: justify;
-                    line-height: 1.6;
-                    margin-bottom: 1em;
-                }
-                
-                .executive-summary ul, .executive-summary ol {
-                    margin-left: 1.5em;
-                    margin-bottom: 1.5em;
-                }
-                
-                .executive-summary li {
-                    margin-bottom: 0.8em;
-                }
-                
-                .executive-summary table {
-                    width: 100%;
-                    margin: 1.5em 0;
-                    border-collapse: collapse;
-                    box-shadow: 0 2px 6px rgba(0, 0, 0, 0.05);
-                }
-                
-                .executive-summary table th {
-                    background-color: #e9ecef;
-                    font-weight: 600;
-                    text-align: left;
-                    padding: 0.8em;
-                    border: 1px solid #dee2e6;
-                    color: #0056b3;
-                }
-                
-                .executive-summary table td {
-                    padding: 0.8em;
-                    border: 1px solid #dee2e6;
-                    vertical-align: top;
-                }
-                
-                .executive-summary strong {
-                    color: #0056b3;
-                    font-weight: 600;
-                }
-                
-                .executive-summary-content {
-                    margin-top: 1.5em;
-                    line-height: 1.6;
-                }
-                
-                .executive-summary-content h2, 
-                .executive-summary-content h3, 
-                .executive-summary-content h4 {
-                    color: #0056b3;
-                    margin-top: 1.5em;
-                    margin-bottom: 0.8em;
-                }
-                
-                .executive-summary-content ol {
-                    counter-reset: item;
-                    list-style-type: none;
-                    margin-left: 0;
-                    padding-left: 0;
-                }
-                
-                .executive-summary-content ol li {
-                    counter-increment: item;
-                    margin-bottom: 1.2em;
-                    padding-left: 2em;
-                    position: relative;
-                }
-                
-                .executive-summary-content ol li:before {
-                    content: counter(item) ".";
-                    position: absolute;
-                    left: 0;
-                    font-weight: bold;
-                    color: #0056b3;
-                }
-            ''', font_config=font_config)
-            
-            # Generate PDF
+            # Generate PDF (the template uses CSS only, so presentational hints are not needed)
             html = HTML(string=html_content, base_url=base_url)
             html.write_pdf(
                 output_path,
-                stylesheets=[css],
-                presentational_hints=True,
-                font_config=font_config
+                stylesheets=[self.css],
+                font_config=self.font_config
             )
             
             print(f"PDF generated successfully: {output_path}")
@@ -1355,12 +1363,22 @@ def process_markdown_files(output_dir: Path, company_name: str, language: str) -
         # Collect sections from markdown files
         sections = []
         
+        # Index the markdown files once instead of stat-ing each section path
+        markdown_entries = {}
+        if markdown_dir.is_dir():
+            with os.scandir(markdown_dir) as entries:
+                markdown_entries = {
+                    entry.name[:-3]: entry
+                    for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()
+                }
+        
         # First, check if an executive summary exists
-        exec_summary_path = markdown_dir / "executive_summary.md"
-        has_exec_summary = exec_summary_path.exists()
+        exec_summary_entry = markdown_entries.get("executive_summary")
         
         # Handle the executive summary first, if it exists
-        if has_exec_summary:
+        if exec_summary_entry and exec_summary_entry.stat().st_size > 0:
+            exec_summary_path = exec_summary_entry.path
             with open(exec_summary_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
@@ -1379,9 +1397,9 @@ def process_markdown_files(output_dir: Path, company_name: str, language: str) -
             if section_id == "executive_summary":
                 continue
                 
-            file_path = markdown_dir / f"{section_id}.md"
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
+            entry = markdown_entries.get(section_id)
+            if entry and entry.stat().st_size > 0:
+                with open(entry.path, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
                 if content.strip():  # Only include non-empty sections
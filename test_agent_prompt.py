@@ -1,7 +1,5 @@
 # test_agent_prompt.py
 
-import asyncio
-import base64
 import os
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional # Added Optional
@@ -14,25 +12,16 @@ from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import time
-import re
-import markdown
-from markdown.extensions import fenced_code, tables, toc, attr_list, def_list, footnotes
-from markdown.extensions.codehilite import CodeHiliteExtension
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
-from jinja2 import Environment, FileSystemLoader
 import yaml
 import logging
-from tqdm import tqdm
 import signal
 import sys
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.logging import RichHandler
 from rich.panel import Panel
-from bs4 import BeautifulSoup
 from pdf_generator import process_markdown_files
-from config import SECTION_ORDER, AVAILABLE_LANGUAGES, PROMPT_FUNCTIONS, LLM_MODEL, LLM_TEMPERATURE
+from config import SECTION_ORDER, AVAILABLE_LANGUAGES, PROMPT_FUNCTIONS, LLM_MODEL, LLM_TEMPERATURE, MAX_CONCURRENT_PROMPTS
 
 # Configure logging
 logging.basicConfig(
@@ -46,6 +35,10 @@ logger = logging.getLogger("rich")
 # Rich console for better output
 console = Console()
 
+# Valid language selection keys and the menu shown to the user
+_LANG_KEYS = frozenset(AVAILABLE_LANGUAGES)
+_LANGUAGE_MENU = "\n".join(f"{key}: {lang}" for key, lang in AVAILABLE_LANGUAGES.items())
+
 # Global flag for graceful shutdown
 shutdown_requested = False
 
@@ -66,10 +59,12 @@ def signal_handler(signum, frame):
 # Load environment variables from .env file
 load_dotenv()
 
+# Token encoding shared by all token counts (OpenAI's cl100k_base)
+_ENCODING = tiktoken.get_encoding("cl100k_base")
+
 def count_tokens(text: str) -> int:
     """Count the number of tokens in a text string."""
-    encoding = tiktoken.get_encoding("cl100k_base")  # Using OpenAI's encoding
-    return len(encoding.encode(text))
+    return len(_ENCODING.encode(text))
 
 def format_time(seconds: float) -> str:
     """Format time in seconds to a human-readable string."""
@@ -83,16 +78,26 @@ def format_time(seconds: float) -> str:
     remaining_minutes = minutes % 60
     return f"{hours} hours {remaining_minutes} minutes {remaining_seconds:.2f} seconds"
 
-def generate_content(client: genai.Client, prompt: str, output_path: Path) -> Dict:
+# Tools available to the model (Google Search); invariant for every request
+_TOOLS = [
+    types.Tool(google_search=types.GoogleSearch()),
+]
+
+def build_generate_content_config() -> types.GenerateContentConfig:
+    """Build the generation config shared by all prompts in a run."""
+    return types.GenerateContentConfig(
+        temperature=LLM_TEMPERATURE,
+        tools=_TOOLS,
+        response_mime_type="text/plain",
+    )
+
+def generate_content(client: genai.Client, prompt: str, output_path: Path, generate_content_config: Optional[types.GenerateContentConfig] = None) -> Dict:
     """Generate content for a single prompt and save to file. Returns token counts and timing."""
     start_time = time.time()
     try:
         # Create output directory if it doesn't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Count input tokens
-        input_tokens = count_tokens(prompt)
-        
         # Create the contents with the prompt
         contents = [
             types.Content(
@@ -100,21 +105,13 @@ def generate_content(client: genai.Client, prompt: str, output_path: Path) -> Di
                 parts=[types.Part.from_text(text=prompt)],
             ),
         ]
-        
-        # Setup tools (Google Search)
-        tools = [
-            types.Tool(google_search=types.GoogleSearch()),
-        ]
-        
-        # Configure the generation
-        generate_content_config = types.GenerateContentConfig(
-            temperature=LLM_TEMPERATURE,
-            tools=tools,
-            response_mime_type="text/plain",
-        )
 
-        # Collect output text
-        full_output = ""
+        # Configure the generation unless the caller supplied a shared config
+        if generate_content_config is None:
+            generate_content_config = build_generate_content_config()
+
+        # Collect output chunks (joined once at the end)
+        output_parts = []
 
         # Open file for writing
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -131,11 +128,12 @@ def generate_content(client: genai.Client, prompt: str, output_path: Path) -> Di
 
                 if chunk.text:
                     f.write(chunk.text)
-                    f.flush()
-                    full_output += chunk.text
+                    output_parts.append(chunk.text)
 
-        # Count output tokens
-        output_tokens = count_tokens(full_output)
+        full_output = "".join(output_parts)
+
+        # Count input and output tokens in a single batch call
+        input_tokens, output_tokens = map(len, _ENCODING.encode_batch([prompt, full_output], num_threads=2))
 
         execution_time = time.time() - start_time
         return {
@@ -165,8 +163,7 @@ def get_user_input() -> tuple[str, Optional[str], Optional[str], list[str], list
     context_company_name = input("Enter Context Company Name (default is NESIC): ").strip() or "NESIC"
 
     print("\nAvailable languages:")
-    for key, lang in AVAILABLE_LANGUAGES.items():
-        print(f"{key}: {lang}")
+    print(_LANGUAGE_MENU)
 
     while True:
         languages = input("\nSelect language(s) (1-10, comma separated, default is 1 for Japanese): ").strip()
@@ -177,7 +174,7 @@ def get_user_input() -> tuple[str, Optional[str], Optional[str], list[str], list
         language_keys = [key.strip() for key in languages.split(",")]
 
         # Validate all language keys
-        if all(key in AVAILABLE_LANGUAGES for key in language_keys):
+        if all(key in _LANG_KEYS for key in language_keys):
             break
         print("Invalid selection. Please choose numbers between 1 and 10, separated by commas.")
 
@@ -221,8 +218,9 @@ def generate_all_prompts(company_name: str, language: str, selected_prompts: lis
     if not api_key:
         raise ValueError("GEMINI_API_KEY not found in .env file")
 
-    # Initialize the client
+    # Initialize the client and the generation config shared by all prompts
     client = genai.Client(api_key=api_key)
+    generate_content_config = build_generate_content_config()
 
     # Create timestamp for the directory
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -254,8 +252,8 @@ def generate_all_prompts(company_name: str, language: str, selected_prompts: lis
     with open(misc_dir / "generation_config.yaml", "w") as f:
         yaml.dump(config, f)
 
-    # Calculate optimal number of workers for prompt generation
-    max_workers_prompts = max(len(selected_prompts), 10)
+    # Bound the number of concurrent API calls; remaining prompts wait in the executor queue
+    max_workers_prompts = max(1, min(MAX_CONCURRENT_PROMPTS, len(selected_prompts)))
 
     # Process all prompts
     results = {}
@@ -277,7 +275,7 @@ def generate_all_prompts(company_name: str, language: str, selected_prompts: lis
             section_tasks[prompt_name] = progress.add_task(task_desc, total=1, visible=True)
 
     with ThreadPoolExecutor(max_workers=max_workers_prompts) as executor:
-        futures = []
+        future_to_name = {}
         for prompt_name, prompt_func_name in selected_prompts:
             if shutdown_requested:
                 break
@@ -291,11 +289,12 @@ def generate_all_prompts(company_name: str, language: str, selected_prompts: lis
                 prompt = prompt_func(company_name, language, ticker=ticker, industry=industry, context_company_name=context_company_name)
             output_path = markdown_dir / f"{prompt_name}.md"
 
-            future = executor.submit(generate_content, client, prompt, output_path)
-            futures.append((prompt_name, future))
+            future = executor.submit(generate_content, client, prompt, output_path, generate_content_config)
+            future_to_name[future] = prompt_name
 
-        # Collect results
-        for prompt_name, future in futures:
+        # Collect results as each prompt finishes
+        for future in as_completed(future_to_name):
+            prompt_name = future_to_name[future]
             try:
                 if not shutdown_requested:
                     result = future.result()
@@ -336,13 +335,26 @@ def generate_all_prompts(company_name: str, language: str, selected_prompts: lis
 
     total_execution_time = time.time() - start_time
 
+    # Aggregate per-prompt results in a single pass
+    total_input_tokens = total_output_tokens = total_tokens = 0
+    successful_prompts = failed_prompts = 0
+    for r in results.values():
+        total_input_tokens += r.get("input_tokens", 0)
+        total_output_tokens += r.get("output_tokens", 0)
+        total_tokens += r.get("total_tokens", 0)
+        status = r.get("status")
+        if status == "success":
+            successful_prompts += 1
+        elif status in ("error", "interrupted"):
+            failed_prompts += 1
+
     # Compile token statistics
     token_stats = {
         "prompts": results,
         "summary": {
-            "total_input_tokens": sum(r.get("input_tokens", 0) for r in results.values()),
-            "total_output_tokens": sum(r.get("output_tokens", 0) for r in results.values()),
-            "total_tokens": sum(r.get("total_tokens", 0) for r in results.values()),
+            "total_input_tokens": total_input_tokens,
+            "total_output_tokens": total_output_tokens,
+            "total_tokens": total_tokens,
             "total_execution_time": total_execution_time,
             "timestamp": datetime.now().isoformat(),
             "company_name": company_name,
@@ -352,16 +364,16 @@ def generate_all_prompts(company_name: str, language: str, selected_prompts: lis
             "model": "gemini-2.5-pro-preview-05-06",
             "temperature": LLM_TEMPERATURE,
             "context_company_name": context_company_name,
-            "successful_prompts": sum(1 for r in results.values() if r.get("status") == "success"),
-            "failed_prompts": sum(1 for r in results.values() if r.get("status") in ["error", "interrupted"]),
+            "successful_prompts": successful_prompts,
+            "failed_prompts": failed_prompts,
             "interrupted": shutdown_requested
         }
     }
 
-    # Save token statistics in misc directory
+    # Save token statistics in misc directory (compact JSON serializes via the C encoder)
     stats_path = misc_dir / "token_usage_report.json"
     with open(stats_path, 'w', encoding='utf-8') as f:
-        json.dump(token_stats, f, indent=2, ensure_ascii=False)
+        f.write(json.dumps(token_stats, ensure_ascii=False, separators=(',', ':')))
 
     return token_stats, base_dir
 
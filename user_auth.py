@@ -4,10 +4,340 @@ User authentication and information collection for the ARA Streamlit app.
 
 import streamlit as st
 import re
+import threading
+from functools import lru_cache, wraps
 from email_validator import validate_email, EmailNotValidError
 from analytics_logger_apps_script import generate_session_id, log_user_session_start
 
 
+# Session state keys set for an authenticated user (cleared on reset)
+_AUTH_KEYS = (
+    'user_authenticated',
+    'user_name',
+    'business_email',
+    'user_company',
+    'session_id',
+    '_auth_ready',
+    '_user_info_cached'
+)
+
+# Cheap shape check run before email-validator: one '@', no whitespace, dotted domain
+_QUICK_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Personal email providers to block
+_PERSONAL_DOMAINS = frozenset({
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+    'yahoo.co.uk', 'yahoo.co.in', 'yahoo.ca', 'yahoo.com.au',
+    'hotmail.co.uk', 'hotmail.fr', 'live.com', 'msn.com',
+    'aol.com', 'icloud.com', 'me.com', 'mac.com',
+    'protonmail.com', 'proton.me', 'mail.com', 'yandex.com',
+    'rediffmail.com', 'zoho.com', 'mailinator.com'
+})
+
+# Common personal email domain patterns ('mail.' also covers 'email.' and 'webmail.')
+_PERSONAL_PATTERN_RE = re.compile(r'mail\.')
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from an inline <style> block."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+# Clean, professional authentication styling (minified once at import)
+_AUTH_CSS = _minify_css("""
+<style>
+/* Brand Colors */
+:root {
+    --primary-navy: #000b37;
+    --primary-lime: #85c20b;
+    --secondary-dark-gray: #474747;
+    --secondary-light-gray: #c7c7c7;
+    --secondary-light-lime: #c3fb54;
+}
+
+.stApp {
+    background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+}
+
+/* Hide sidebar completely */
+section[data-testid="stSidebar"] {
+    display: none !important;
+}
+
+/* Authentication card */
+.auth-card {
+    background: white;
+    border-radius: 16px;
+    box-shadow: 0 10px 30px rgba(0, 11, 55, 0.12);
+    padding: 2rem;
+    width: 100%;
+    max-width: 100%;
+    border: 1px solid rgba(133, 194, 11, 0.1);
+    position: relative;
+    overflow: hidden;
+    margin-bottom: 1rem;
+}
+
+.auth-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 4px;
+    background: linear-gradient(90deg, var(--primary-lime) 0%, var(--secondary-light-lime) 100%);
+}
+
+/* Logo and header */
+.auth-logo {
+    max-width: 60px;
+    max-height: 60px;
+    margin: 0 auto 1rem auto;
+    display: block;
+}
+
+.auth-title {
+    font-size: 2rem;
+    font-weight: 700;
+    color: var(--primary-navy);
+    text-align: center;
+    margin-bottom: 0.5rem;
+    line-height: 1.2;
+}
+
+.auth-subtitle {
+    font-size: 1rem;
+    color: var(--secondary-dark-gray);
+    text-align: center;
+    margin-bottom: 1.5rem;
+    line-height: 1.3;
+}
+
+.auth-highlight {
+    color: var(--primary-lime);
+    font-weight: 600;
+}
+
+/* Form styling */
+.auth-form-header {
+    text-align: center;
+    margin-bottom: 1.5rem;
+}
+
+.auth-form-title {
+    font-size: 1.3rem;
+    font-weight: 600;
+    color: var(--primary-navy);
+    margin-bottom: 0.3rem;
+}
+
+.auth-form-subtitle {
+    font-size: 0.9rem;
+    color: var(--secondary-dark-gray);
+    margin: 0;
+}
+
+/* Input styling */
+.stTextInput > div > div > input {
+    border: 2px solid #e2e8f0 !important;
+    border-radius: 8px !important;
+    padding: 0.75rem !important;
+    font-size: 1rem !important;
+    background: #f8fafc !important;
+    transition: all 0.3s ease !important;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: var(--primary-lime) !important;
+    background: white !important;
+    box-shadow: 0 0 0 3px rgba(133, 194, 11, 0.1) !important;
+}
+
+.stTextInput > div > div > input:hover {
+    border-color: var(--primary-navy) !important;
+    background: white !important;
+}
+
+.stTextInput > label {
+    font-weight: 600 !important;
+    color: var(--primary-navy) !important;
+    font-size: 1rem !important;
+    margin-bottom: 0.5rem !important;
+}
+
+/* Button styling */
+.stButton > button {
+    background: linear-gradient(135deg, var(--primary-lime) 0%, var(--secondary-light-lime) 100%) !important;
+    color: var(--primary-navy) !important;
+    border: none !important;
+    border-radius: 12px !important;
+    padding: 1rem 2rem !important;
+    font-size: 1.1rem !important;
+    font-weight: 700 !important;
+    width: 100% !important;
+    transition: all 0.3s ease !important;
+    box-shadow: 0 4px 15px rgba(133, 194, 11, 0.3) !important;
+    text-transform: uppercase !important;
+    letter-spacing: 1px !important;
+}
+
+.stButton > button:hover {
+    background: linear-gradient(135deg, var(--secondary-light-lime) 0%, var(--primary-lime) 100%) !important;
+    transform: translateY(-2px) !important;
+    box-shadow: 0 8px 25px rgba(133, 194, 11, 0.4) !important;
+}
+
+.stButton > button:active {
+    transform: translateY(0) !important;
+}
+
+/* Email hint */
+.email-hint {
+    background: #fef3c7;
+    border: 1px solid #f59e0b;
+    border-radius: 8px;
+    padding: 0.75rem;
+    margin: 1rem 0;
+    font-size: 0.9rem;
+    color: #92400e;
+    text-align: center;
+}
+
+/* Simple benefits */
+.auth-benefits {
+    margin-top: 1.5rem;
+    padding-top: 1.5rem;
+    border-top: 1px solid #e2e8f0;
+}
+
+.benefit-item {
+    display: flex;
+    align-items: center;
+    gap: 0.75rem;
+    margin-bottom: 1rem;
+    font-size: 0.95rem;
+    color: var(--secondary-dark-gray);
+}
+
+.benefit-icon {
+    font-size: 1.2rem;
+    color: var(--primary-lime);
+}
+
+/* Compact spacing */
+.main .block-container {
+    padding: 0.5rem 1rem !important;
+    max-width: 100% !important;
+}
+
+/* Error styling */
+.stAlert {
+    border-radius: 8px !important;
+    margin: 0.5rem 0 !important;
+}
+</style>
+""")
+
+# Benefits listed below the form: (icon, description)
+_BENEFITS = (
+    ("🏢", "Professional company analysis reports"),
+    ("⚡", "Generate comprehensive reports in 15-20 minutes"),
+    ("🌍", "Multi-language support for global reach"),
+    ("📊", "Financial, strategic, and competitive insights"),
+)
+
+_BENEFIT_ITEM_TMPL = (
+    '<div class="benefit-item">'
+    '<span class="benefit-icon">{icon}</span>'
+    '<span>{text}</span>'
+    '</div>'
+)
+
+_BENEFITS_HTML = (
+    '<div class="auth-benefits">'
+    + "".join(_BENEFIT_ITEM_TMPL.format(icon=icon, text=text) for icon, text in _BENEFITS)
+    + '</div>'
+)
+
+
+# Auth page logo, served by Streamlit static file serving (see .streamlit/config.toml)
+_LOGO_HTML = '<img src="./app/static/supervity_logo.png" class="auth-logo">'
+
+# Authentication card, form header and email hint, sent as a single markdown element
+_AUTH_HEADER_HTML = f"""
+<div class="auth-card">
+    {_LOGO_HTML}
+    <h1 class="auth-title">Account Research <span class="auth-highlight">AI Agent</span></h1>
+    <p class="auth-subtitle">Professional company intelligence reports in minutes</p>
+</div>
+
+<div class="auth-form-header">
+    <h2 class="auth-form-title">Access Platform</h2>
+    <p class="auth-form-subtitle">Start generating comprehensive business research reports</p>
+</div>
+
+<div class="email-hint">
+    💡 <strong>Business Email Required:</strong> Use your company email address. Personal emails (Gmail, Yahoo, Hotmail, etc.) are not accepted.
+</div>
+"""
+
+# Compact user info footer styling (minified once at import)
+_FOOTER_CSS = _minify_css("""
+<style>
+.user-info-footer {
+    background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%);
+    border: 1px solid #cbd5e1;
+    border-radius: 8px;
+    padding: 0.75rem 1rem;
+    margin: 1rem 0 0.5rem 0;
+    font-size: 0.85rem;
+    color: #475569;
+    text-align: center;
+}
+
+.user-info-content {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    flex-wrap: wrap;
+    gap: 1.5rem;
+}
+
+.user-badge-footer {
+    background: #000b37;
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 15px;
+    font-size: 0.75rem;
+    font-weight: 500;
+}
+</style>
+""")
+
+# Footer user info; filled with (name, email, company_display, session_id)
+_USER_FOOTER_TMPL = """
+<div class="user-info-footer">
+    <div class="user-info-content">
+        <span><strong>👤 %s</strong></span>
+        <span>📧 %s%s</span>
+        <span class="user-badge-footer">Session: %s</span>
+    </div>
+</div>
+"""
+
+
+def _match_personal_domain(domain: str) -> str:
+    """Return the blocked provider that domain is, or is a subdomain of, or "" if none."""
+    while '.' in domain:
+        if domain in _PERSONAL_DOMAINS:
+            return domain
+        domain = domain.partition('.')[2]
+    return ""
+
+
 def is_valid_business_email(email: str) -> tuple[bool, str]:
     """
     Validate business email address format and domain.
@@ -18,29 +348,32 @@ def is_valid_business_email(email: str) -> tuple[bool, str]:
     Returns:
         tuple: (is_valid, error_message)
     """
+    email = email.strip().lower()
+    
+    # Reject obviously malformed input (254 is the RFC 5321 length limit)
+    if len(email) > 254 or not _QUICK_EMAIL_RE.match(email):
+        return False, "Please enter a valid email address format."
+    
+    return _validate_business_email_cached(email)
+
+
+@lru_cache(maxsize=2048)
+def _validate_business_email_cached(email: str) -> tuple[bool, str]:
+    """Validate a stripped, lower-cased email; results are cached across reruns."""
     try:
-        # Use email-validator library for robust validation
-        valid = validate_email(email)
-        email = valid.email  # Get normalized email
+        # Use email-validator library for robust validation; the check is
+        # purely lexical, so skip the DNS deliverability lookup
+        valid = validate_email(email, check_deliverability=False)
         
-        # Get domain from email
-        domain = email.split('@')[1].lower()
-        
-        # List of personal email providers to block
-        personal_domains = {
-            'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 
-            'yahoo.co.uk', 'yahoo.co.in', 'yahoo.ca', 'yahoo.com.au',
-            'hotmail.co.uk', 'hotmail.fr', 'live.com', 'msn.com',
-            'aol.com', 'icloud.com', 'me.com', 'mac.com',
-            'protonmail.com', 'proton.me', 'mail.com', 'yandex.com',
-            'rediffmail.com', 'zoho.com', 'mailinator.com'
-        }
+        # Use the validator's normalized domain
+        domain = valid.domain.lower()
         
-        if domain in personal_domains:
-            return False, f"Please use a business email address. {domain} is not allowed."
+        blocked_domain = _match_personal_domain(domain)
+        if blocked_domain:
+            return False, f"Please use a business email address. {blocked_domain} is not allowed."
         
         # Additional check for common personal email patterns
-        if any(pattern in domain for pattern in ['mail.', 'email.', 'webmail.']):
+        if _PERSONAL_PATTERN_RE.search(domain) is not None:
             return False, "Please use a business email address."
             
         return True, ""
@@ -56,262 +389,15 @@ def show_user_info_form() -> bool:
     Returns:
         bool: True if user info was successfully collected, False otherwise
     """
+    # Nothing to collect if the user is already authenticated
+    if check_user_authentication():
+        return True
     
     # Clean, professional authentication styling
-    st.markdown("""
-    <style>
-    /* Brand Colors */
-    :root {
-        --primary-navy: #000b37;
-        --primary-lime: #85c20b;
-        --secondary-dark-gray: #474747;
-        --secondary-light-gray: #c7c7c7;
-        --secondary-light-lime: #c3fb54;
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-    }
-    
-    /* Hide sidebar completely */
-    section[data-testid="stSidebar"] {
-        display: none !important;
-    }
-    
-    /* Authentication container */
-    .auth-container {
-        min-height: 100vh;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        padding: 1rem;
-    }
-    
-    .auth-card {
-        background: white;
-        border-radius: 16px;
-        box-shadow: 0 10px 30px rgba(0, 11, 55, 0.12);
-        padding: 2rem;
-        width: 100%;
-        max-width: 100%;
-        border: 1px solid rgba(133, 194, 11, 0.1);
-        position: relative;
-        overflow: hidden;
-        margin-bottom: 1rem;
-    }
-    
-    .auth-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, var(--primary-lime) 0%, var(--secondary-light-lime) 100%);
-    }
-    
-    /* Logo and header */
-    .auth-logo {
-        max-width: 60px;
-        max-height: 60px;
-        margin: 0 auto 1rem auto;
-        display: block;
-    }
-    
-    .auth-title {
-        font-size: 2rem;
-        font-weight: 700;
-        color: var(--primary-navy);
-        text-align: center;
-        margin-bottom: 0.5rem;
-        line-height: 1.2;
-    }
-    
-    .auth-subtitle {
-        font-size: 1rem;
-        color: var(--secondary-dark-gray);
-        text-align: center;
-        margin-bottom: 1.5rem;
-        line-height: 1.3;
-    }
-    
-    .auth-highlight {
-        color: var(--primary-lime);
-        font-weight: 600;
-    }
-    
-    /* Form styling */
-    .auth-form-header {
-        text-align: center;
-        margin-bottom: 1.5rem;
-    }
-    
-    .auth-form-title {
-        font-size: 1.3rem;
-        font-weight: 600;
-        color: var(--primary-navy);
-        margin-bottom: 0.3rem;
-    }
-    
-    .auth-form-subtitle {
-        font-size: 0.9rem;
-        color: var(--secondary-dark-gray);
-        margin: 0;
-    }
-    
-    /* Input styling */
-    .stTextInput > div > div > input {
-        border: 2px solid #e2e8f0 !important;
-        border-radius: 8px !important;
-        padding: 0.75rem !important;
-        font-size: 1rem !important;
-        background: #f8fafc !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: var(--primary-lime) !important;
-        background: white !important;
-        box-shadow: 0 0 0 3px rgba(133, 194, 11, 0.1) !important;
-    }
-    
-    .stTextInput > div > div > input:hover {
-        border-color: var(--primary-navy) !important;
-        background: white !important;
-    }
-    
-    .stTextInput > label {
-        font-weight: 600 !important;
-        color: var(--primary-navy) !important;
-        font-size: 1rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, var(--primary-lime) 0%, var(--secondary-light-lime) 100%) !important;
-        color: var(--primary-navy) !important;
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 1rem 2rem !important;
-        font-size: 1.1rem !important;
-        font-weight: 700 !important;
-        width: 100% !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 15px rgba(133, 194, 11, 0.3) !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, var(--secondary-light-lime) 0%, var(--primary-lime) 100%) !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(133, 194, 11, 0.4) !important;
-    }
-    
-    .stButton > button:active {
-        transform: translateY(0) !important;
-    }
-    
-    /* Email hint */
-    .email-hint {
-        background: #fef3c7;
-        border: 1px solid #f59e0b;
-        border-radius: 8px;
-        padding: 0.75rem;
-        margin: 1rem 0;
-        font-size: 0.9rem;
-        color: #92400e;
-        text-align: center;
-    }
-    
-    /* Simple benefits */
-    .auth-benefits {
-        margin-top: 1.5rem;
-        padding-top: 1.5rem;
-        border-top: 1px solid #e2e8f0;
-    }
-    
-    .benefit-item {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        margin-bottom: 1rem;
-        font-size: 0.95rem;
-        color: var(--secondary-dark-gray);
-    }
-    
-    .benefit-icon {
-        font-size: 1.2rem;
-        color: var(--primary-lime);
-    }
-    
-    /* Compact spacing */
-    .main .block-container {
-        padding: 0.5rem 1rem !important;
-        max-width: 100% !important;
-    }
-    
-    /* Error styling */
-    .stAlert {
-        border-radius: 8px !important;
-        margin: 0.5rem 0 !important;
-    }
-
-    /* Loading state */
-    .auth-loading {
-        opacity: 0.7;
-        pointer-events: none;
-    }
-    
-    /* Success message */
-    .auth-success {
-        background: #f0f9ff;
-        border: 1px solid #0ea5e9;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        margin: 1rem 0;
-        color: #0369a1;
-        font-weight: 600;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Get logo for display
-    from pathlib import Path
-    import base64
-    
-    @st.cache_data
-    def get_auth_logo_base64():
-        try:
-            logo_path = Path("templates/assets/supervity_logo.png")
-            if not logo_path.exists():
-                return ""
-            with open(logo_path, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode()
-        except Exception:
-            return ""
+    st.markdown(_AUTH_CSS, unsafe_allow_html=True)
     
     # Single clean authentication card
-    logo_base64 = get_auth_logo_base64()
-    logo_html = f'<img src="data:image/png;base64,{logo_base64}" class="auth-logo">' if logo_base64 else ""
-    
-    st.markdown(f"""
-    <div class="auth-card">
-        {logo_html}
-        <h1 class="auth-title">Account Research <span class="auth-highlight">AI Agent</span></h1>
-        <p class="auth-subtitle">Professional company intelligence reports in minutes</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Form header section
-    st.markdown("""
-    <div class="auth-form-header">
-        <h2 class="auth-form-title">Access Platform</h2>
-        <p class="auth-form-subtitle">Start generating comprehensive business research reports</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_AUTH_HEADER_HTML, unsafe_allow_html=True)
     
     # Clean form without cluttered layout
     with st.form("user_info_form", clear_on_submit=False):
@@ -336,13 +422,6 @@ def show_user_info_form() -> bool:
             help="Helps personalize your reports"
         )
         
-        # Clear email hint
-        st.markdown("""
-        <div class="email-hint">
-            💡 <strong>Business Email Required:</strong> Use your company email address. Personal emails (Gmail, Yahoo, Hotmail, etc.) are not accepted.
-        </div>
-        """, unsafe_allow_html=True)
-        
         # Single, prominent submit button
         submit_button = st.form_submit_button(
             "Access Platform",
@@ -351,76 +430,68 @@ def show_user_info_form() -> bool:
         )
     
     # Simple benefits below form
-    st.markdown("""
-    <div class="auth-benefits">
-        <div class="benefit-item">
-            <span class="benefit-icon">🏢</span>
-            <span>Professional company analysis reports</span>
-        </div>
-        <div class="benefit-item">
-            <span class="benefit-icon">⚡</span>
-            <span>Generate comprehensive reports in 15-20 minutes</span>
-        </div>
-        <div class="benefit-item">
-            <span class="benefit-icon">🌍</span>
-            <span>Multi-language support for global reach</span>
-        </div>
-        <div class="benefit-item">
-            <span class="benefit-icon">📊</span>
-            <span>Financial, strategic, and competitive insights</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_BENEFITS_HTML, unsafe_allow_html=True)
     
     # Handle form submission
     if submit_button:
+        # Strip each input (and lower-case the email) once and reuse it below
+        name = (user_name or "").strip()
+        email = (business_email or "").strip().lower()
+        company = (user_company or "").strip()
+        
         # Validation with clean error display
         errors = []
         
-        if not user_name or not user_name.strip():
+        if not name:
             errors.append("Please enter your full name")
         
-        if not business_email or not business_email.strip():
+        if not email:
             errors.append("Please enter your business email address")
         else:
-            email_valid, email_error = is_valid_business_email(business_email.strip())
+            email_valid, email_error = is_valid_business_email(email)
             if not email_valid:
                 errors.append(email_error)
         
         # Display errors if any
         if errors:
-            for error in errors:
-                st.error(f"⚠️ {error}")
+            st.error("⚠️ Please fix the following issues:\n\n" + "\n".join(f"- {error}" for error in errors))
             return False
         
         # If validation passes, store user info and show success
         session_id = generate_session_id()
         
-        # Store in session state
-        st.session_state.user_authenticated = True
-        st.session_state.user_name = user_name.strip()
-        st.session_state.business_email = business_email.strip().lower()
-        st.session_state.user_company = user_company.strip() if user_company else ""
-        st.session_state.session_id = session_id
-        
-        # Log session start
-        log_user_session_start(
-            user_name=st.session_state.user_name,
-            business_email=st.session_state.business_email,
-            company=st.session_state.user_company,
-            session_id=session_id
-        )
+        # Store in session state in one batch; _auth_ready marks the fields complete
+        user_info = {
+            'name': name,
+            'email': email,
+            'company': company,
+            'session_id': session_id
+        }
+        st.session_state.update({
+            'user_authenticated': True,
+            'user_name': user_info['name'],
+            'business_email': user_info['email'],
+            'user_company': user_info['company'],
+            'session_id': session_id,
+            '_user_info_cached': user_info,
+            '_auth_ready': True
+        })
         
-        # Show professional success message
-        st.markdown("""
-        <div class="auth-success">
-            🎉 <strong>Welcome aboard!</strong> Redirecting you to the platform...
-        </div>
-        """, unsafe_allow_html=True)
+        # Log session start in the background so the HTTP call doesn't delay login
+        # (the logger swallows its own network errors)
+        threading.Thread(
+            target=log_user_session_start,
+            kwargs={
+                'user_name': user_info['name'],
+                'business_email': user_info['email'],
+                'company': user_info['company'],
+                'session_id': session_id
+            },
+            daemon=True
+        ).start()
         
-        # Smooth transition without jarring rerun
-        import time
-        time.sleep(1)  # Brief pause for better UX
+        # Toasts survive the rerun, so the welcome shows on the platform page
+        st.toast("Welcome aboard! Redirecting you to the platform...", icon="🎉")
         st.rerun()
         
     return False
@@ -433,12 +504,8 @@ def check_user_authentication() -> bool:
     Returns:
         bool: True if user is authenticated, False otherwise
     """
-    return (
-        st.session_state.get('user_authenticated', False) and
-        st.session_state.get('user_name') and
-        st.session_state.get('business_email') and
-        st.session_state.get('session_id')
-    )
+    # Set once at login, after all required user fields are stored
+    return st.session_state.get('_auth_ready', False)
 
 
 def get_user_info() -> dict:
@@ -448,27 +515,17 @@ def get_user_info() -> dict:
     Returns:
         dict: User information including name, email, company, and session_id
     """
-    return {
-        'name': st.session_state.get('user_name', ''),
-        'email': st.session_state.get('business_email', ''),
-        'company': st.session_state.get('user_company', ''),
-        'session_id': st.session_state.get('session_id', '')
-    }
+    user_info = st.session_state.get('_user_info_cached')
+    if user_info is None:
+        return {'name': '', 'email': '', 'company': '', 'session_id': ''}
+    return user_info
 
 
 def reset_user_session():
     """Reset user session - useful for debugging or logout functionality."""
-    keys_to_remove = [
-        'user_authenticated',
-        'user_name', 
-        'business_email',
-        'user_company',
-        'session_id'
-    ]
-    
-    for key in keys_to_remove:
-        if key in st.session_state:
-            del st.session_state[key]
+    ss = st.session_state
+    for key in _AUTH_KEYS:
+        ss.pop(key, None)
 
 
 def show_user_info_header():
@@ -476,50 +533,14 @@ def show_user_info_header():
     if check_user_authentication():
         user_info = get_user_info()
         
-        # Compact user info display for footer
-        st.markdown("""
-        <style>
-        .user-info-footer {
-            background: linear-gradient(90deg, #f8fafc 0%, #e2e8f0 100%);
-            border: 1px solid #cbd5e1;
-            border-radius: 8px;
-            padding: 0.75rem 1rem;
-            margin: 1rem 0 0.5rem 0;
-            font-size: 0.85rem;
-            color: #475569;
-            text-align: center;
-        }
-        
-        .user-info-content {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            flex-wrap: wrap;
-            gap: 1.5rem;
-        }
-        
-        .user-badge-footer {
-            background: #000b37;
-            color: white;
-            padding: 0.3rem 0.8rem;
-            border-radius: 15px;
-            font-size: 0.75rem;
-            font-weight: 500;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
         company_display = f" • {user_info['company']}" if user_info['company'] else ""
         
-        st.markdown(f"""
-        <div class="user-info-footer">
-            <div class="user-info-content">
-                <span><strong>👤 {user_info['name']}</strong></span>
-                <span>📧 {user_info['email']}{company_display}</span>
-                <span class="user-badge-footer">Session: {user_info['session_id']}</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Compact user info display for footer; styles and markup in one element
+        st.markdown(
+            _FOOTER_CSS
+            + _USER_FOOTER_TMPL % (user_info['name'], user_info['email'], company_display, user_info['session_id']),
+            unsafe_allow_html=True
+        )
 
 
 def require_authentication(func):
@@ -532,10 +553,11 @@ def require_authentication(func):
     Returns:
         Wrapped function that checks authentication first
     """
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        if not check_user_authentication():
-            show_user_info_form()
-            return None
-        return func(*args, **kwargs)
+        if st.session_state.get('_auth_ready'):
+            return func(*args, **kwargs)
+        show_user_info_form()
+        return None
     
     return wrapper 
\ No newline at end of file